@@ -20,32 +20,26 @@ export class Flow {
   async run(input, context) {
     const validatedInput = this.inputSchema ? this._parseWithSchema(this.inputSchema, input, 'input') : input;
     const results = {};
-    const executed = new Set();
     const stepNames = Object.keys(this.steps);
-    let guard = 0;
-
-    while (executed.size < stepNames.length) {
-      if (guard > stepNames.length * 2) {
-        throw new FlowError('Circular dependency detected in flow steps');
-      }
-
-      for (const name of stepNames) {
-        if (executed.has(name)) continue;
-        const step = this.steps[name];
-        const deps = step.dependsOn || [];
-        const ready = deps.every((dep) => executed.has(dep));
-        if (!ready) continue;
-
-        try {
-          const result = await step.run({ input: validatedInput, context, stepResults: results });
-          results[name] = result;
-          executed.add(name);
-        } catch (error) {
-          throw new FlowError(`Step '${name}' failed`, error);
-        }
+    this._assertAcyclic(stepNames);
+
+    // Each step starts as soon as its own dependencies resolve, so a slow step only delays the
+    // steps that depend on it.
+    const pending = {};
+    const start = (name) => {
+      if (!pending[name]) {
+        const deps = this.steps[name].dependsOn || [];
+        pending[name] = Promise.all(deps.map(start)).then(async () => {
+          try {
+            results[name] = await this.steps[name].run({ input: validatedInput, context, stepResults: results });
+          } catch (error) {
+            throw new FlowError(`Step '${name}' failed`, error);
+          }
+        });
       }
-      guard += 1;
-    }
+      return pending[name];
+    };
+    await Promise.all(stepNames.map(start));
 
     const outputCandidate = this.buildOutput ? this.buildOutput(results) : results[stepNames[stepNames.length - 1]];
     const output = this.outputSchema
@@ -55,6 +49,25 @@ export class Flow {
     return { output, stepResults: results };
   }
 
+  _assertAcyclic(stepNames) {
+    const done = new Set();
+    const visiting = new Set();
+    const visit = (name) => {
+      if (done.has(name)) return;
+      if (!this.steps[name]) {
+        throw new FlowError(`Unknown step '${name}' in flow dependencies`);
+      }
+      if (visiting.has(name)) {
+        throw new FlowError('Circular dependency detected in flow steps');
+      }
+      visiting.add(name);
+      (this.steps[name].dependsOn || []).forEach(visit);
+      visiting.delete(name);
+      done.add(name);
+    };
+    stepNames.forEach(visit);
+  }
+
   _parseWithSchema(schema, value, label) {
     try {
       return schema.parse(value);
@@ -2,23 +2,39 @@ import Anthropic from '@anthropic-ai/sdk';
 import { SYSTEM_PROMPT, buildUserPrompt, parseAnalysis } from '../prompts.js';
 import type { AnalysisOutput, DomainDefinition, ResearchOutput } from '../types.js';
 import { logger } from '../utils/logger.js';
+import { ResponseCache, hashKey } from '../utils/response-cache.js';
+
+export const MODEL = 'claude-sonnet-4-5-20250929';
+// Built once at import: the prompt's digest stands in for its full text in response-cache keys.
+export const SYSTEM_PROMPT_DIGEST = hashKey(SYSTEM_PROMPT);
 
 export interface AnthropicClientOptions {
   apiKey?: string;
   temperature?: number;
+  maxRetries?: number;
+  timeoutMs?: number;
+  cache?: ResponseCache;
 }
 
 export class AnthropicClientWrapper {
   private readonly client: Anthropic;
   private readonly temperature: number;
+  private readonly cache?: ResponseCache;
 
   constructor(options: AnthropicClientOptions = {}) {
     const apiKey = options.apiKey ?? process.env.ANTHROPIC_API_KEY;
     if (!apiKey) {
       throw new Error('ANTHROPIC_API_KEY environment variable is not set');
     }
-    this.client = new Anthropic({ apiKey });
+    // The SDK keeps one pooled keep-alive agent per client and retries 408/409/429/5xx with
+    // exponential backoff, so reusing this instance avoids a fresh TLS handshake per call.
+    this.client = new Anthropic({
+      apiKey,
+      maxRetries: options.maxRetries ?? 3,
+      timeout: options.timeoutMs ?? 120_000
+    });
     this.temperature = options.temperature ?? 0.3;
+    this.cache = options.cache;
   }
 
   async analyze(
@@ -27,11 +43,18 @@ export class AnthropicClientWrapper {
     currentContent: string
   ): Promise<AnalysisOutput> {
     const userPrompt = buildUserPrompt(domain, researchOutput, currentContent);
+    const cacheKey = hashKey(MODEL, SYSTEM_PROMPT_DIGEST, userPrompt, this.temperature);
+    const cached = await this.cache?.get(cacheKey);
+    if (cached !== undefined) {
+      logger.info('Using cached Anthropic response', { key: cacheKey.slice(0, 12) });
+      return parseAnalysis(cached);
+    }
+
     logger.info('Sending prompt to Anthropic', { temperature: this.temperature });
 
     try {
       const response = await this.client.messages.create({
-        model: 'claude-sonnet-4-5-20250929',
+        model: MODEL,
         system: SYSTEM_PROMPT,
         max_tokens: 4000,
         temperature: this.temperature,
@@ -46,6 +69,9 @@ export class AnthropicClientWrapper {
       const contentBlock = response.content[0];
       const text = contentBlock?.type === 'text' ? contentBlock.text : '';
       logger.debug('Received response from Anthropic', { tokens: response.usage?.output_tokens });
+      if (text) {
+        await this.cache?.set(cacheKey, text);
+      }
       return parseAnalysis(text);
     } catch (error) {
       const err = error as Error & { status?: number; error?: { type?: string; message?: string } };
@@ -1,14 +1,22 @@
 import { Octokit } from '@octokit/rest';
 import { logger } from '../utils/logger.js';
+import { isRateLimitError, withRetry } from '../utils/retry.js';
 
 export interface GitHubClientOptions {
   token?: string;
   repository?: string;
 }
 
+export interface IssueSummary {
+  number: number;
+  html_url: string;
+}
+
 export class GitHubClient {
   private readonly octokit: Octokit;
   private readonly repository: string;
+  // Issues created by this process, by title; the search index may not list them yet.
+  private readonly createdIssues = new Map<string, IssueSummary>();
 
   constructor(options: GitHubClientOptions = {}) {
     const token = options.token ?? process.env.GITHUB_TOKEN;
@@ -25,26 +33,52 @@ export class GitHubClient {
     this.repository = repository;
   }
 
-  async findExistingIssue(titlePrefix: string) {
+  async findExistingIssue(titlePrefix: string): Promise<IssueSummary | undefined> {
+    for (const [title, issue] of this.createdIssues) {
+      // Titles are `${prefix} - YYYY-MM-DD`; requiring the separator stops "Claude" from claiming
+      // the issue created for "Claude Commands".
+      if (title.startsWith(`${titlePrefix} - `)) return issue;
+    }
+
     const query = `repo:${this.repository} is:issue is:open in:title "${titlePrefix}"`;
-    const response = await this.octokit.search.issuesAndPullRequests({ q: query, per_page: 1 });
+    const response = await withRetry(
+      () => this.octokit.search.issuesAndPullRequests({ q: query, per_page: 1 }),
+      { label: 'GitHub issue search' }
+    );
     const item = response.data.items.at(0);
     if (item) {
       logger.info('Found existing issue', { number: item.number });
+      return { number: item.number, html_url: item.html_url };
     }
-    return item;
+    return undefined;
   }
 
   async createIssue(payload: { title: string; body: string; labels?: string[] }) {
     const [owner, repo] = this.repository.split('/');
-    const response = await this.octokit.issues.create({ owner, repo, ...payload });
+    const response = await withRetry(() => this.octokit.issues.create({ owner, repo, ...payload }), {
+      label: 'GitHub issue creation',
+      shouldRetry: isRateLimitError
+    });
     logger.info('Created GitHub issue', { number: response.data.number });
+    this.createdIssues.set(payload.title, { number: response.data.number, html_url: response.data.html_url });
     return response.data;
   }
 
+  async isIssueOpen(issueNumber: number) {
+    const [owner, repo] = this.repository.split('/');
+    const response = await withRetry(
+      () => this.octokit.issues.get({ owner, repo, issue_number: issueNumber }),
+      { label: 'GitHub issue fetch' }
+    );
+    return response.data.state === 'open';
+  }
+
   async addComment(issueNumber: number, body: string) {
     const [owner, repo] = this.repository.split('/');
-    const response = await this.octokit.issues.createComment({ owner, repo, issue_number: issueNumber, body });
+    const response = await withRetry(
+      () => this.octokit.issues.createComment({ owner, repo, issue_number: issueNumber, body }),
+      { label: 'GitHub comment', shouldRetry: isRateLimitError }
+    );
     logger.info('Added GitHub comment', { number: issueNumber });
     return response.data;
   }
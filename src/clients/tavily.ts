@@ -1,15 +1,21 @@
-import { setTimeout as sleep } from 'node:timers/promises';
 import { setTimeout as createTimeout } from 'node:timers';
 import { logger } from '../utils/logger.js';
 import type { SearchResult } from '../types.js';
+import { ResponseCache, hashKey } from '../utils/response-cache.js';
+import { withRetry } from '../utils/retry.js';
 
 const TAVILY_API_URL = 'https://api.tavily.com/search';
 const DEFAULT_TIMEOUT_MS = 30_000;
+const REQUEST_HEADERS = { 'content-type': 'application/json' };
+// Bump when the cached payload shape changes so stale entries are never decoded.
+const CACHE_FORMAT = 3;
+const PREVIEW_LENGTH = 200;
 
 export interface TavilyClientOptions {
   apiKey?: string;
   maxRetries?: number;
   timeoutMs?: number;
+  cache?: ResponseCache;
 }
 
 export interface TavilyResponse {
@@ -22,79 +28,97 @@ export interface TavilyResponse {
   }>;
 }
 
+export interface TavilySearchOutput {
+  summary: string;
+  sources: SearchResult[];
+}
+
 export class TavilyClient {
   private readonly apiKey: string;
   private readonly maxRetries: number;
   private readonly timeoutMs: number;
+  private readonly cache?: ResponseCache;
 
   constructor(options: TavilyClientOptions = {}) {
     this.apiKey = options.apiKey ?? process.env.TAVILY_API_KEY ?? '';
     this.maxRetries = options.maxRetries ?? 3;
     this.timeoutMs = options.timeoutMs ?? DEFAULT_TIMEOUT_MS;
+    this.cache = options.cache;
 
     if (!this.apiKey) {
       throw new Error('TAVILY_API_KEY environment variable is not set');
     }
   }
 
-  async search(query: string, opts?: { maxResults?: number; excludeDomains?: string[]; includeDomains?: string[] }): Promise<{
-    summary: string;
-    sources: SearchResult[];
-  }> {
-    const payload = {
+  async search(
+    query: string,
+    opts?: { maxResults?: number; excludeDomains?: string[]; includeDomains?: string[] }
+  ): Promise<TavilySearchOutput> {
+    const maxResults = opts?.maxResults ?? 5;
+    const includeDomains = opts?.includeDomains ?? [];
+    const excludeDomains = opts?.excludeDomains ?? [];
+
+    const cacheKey = hashKey(CACHE_FORMAT, query, maxResults, includeDomains.join(','), excludeDomains.join(','));
+    const cached = await this.cache?.get(cacheKey);
+    if (cached !== undefined) {
+      // Entries already hold the narrowed output, so a hit decodes straight into the final shape.
+      logger.info('Using cached Tavily response', { key: cacheKey.slice(0, 12) });
+      return JSON.parse(cached) as TavilySearchOutput;
+    }
+
+    const body = JSON.stringify({
       api_key: this.apiKey,
       query,
       search_depth: 'advanced',
       include_answer: true,
-      max_results: opts?.maxResults ?? 5,
-      include_domains: opts?.includeDomains ?? [],
-      exclude_domains: opts?.excludeDomains ?? []
-    };
+      max_results: maxResults,
+      include_domains: includeDomains,
+      exclude_domains: excludeDomains
+    });
 
-    let lastError: unknown;
-    for (let attempt = 1; attempt <= this.maxRetries; attempt += 1) {
-      try {
+    return withRetry(
+      async (attempt) => {
         const controller = new AbortController();
         const timer = createTimeout(() => controller.abort(), this.timeoutMs);
 
-        const response = await fetch(TAVILY_API_URL, {
-          method: 'POST',
-          headers: { 'content-type': 'application/json' },
-          body: JSON.stringify(payload),
-          signal: controller.signal
-        });
-        clearTimeout(timer);
-
-        if (!response.ok) {
-          const text = await response.text();
-          throw new Error(`Tavily responded with ${response.status}: ${text}`);
-        }
-
-        const data = (await response.json()) as TavilyResponse;
-        const sources: SearchResult[] =
-          data.results?.map((result) => ({
-            title: result.title,
-            url: result.url,
-            content: result.content,
-            score: result.score
-          })) ?? [];
+        try {
+          const response = await fetch(TAVILY_API_URL, {
+            method: 'POST',
+            headers: REQUEST_HEADERS,
+            body,
+            signal: controller.signal
+          });
 
-        logger.info('Tavily search completed', { attempt, results: sources.length });
-        return {
-          summary: data.answer ?? 'No summary available.',
-          sources
-        };
-      } catch (error) {
-        lastError = error;
-        logger.warn('Tavily search failed', {
-          attempt,
-          error: (error as Error).message
-        });
-        if (attempt === this.maxRetries) break;
-        await sleep(500 * attempt);
-      }
-    }
+          if (!response.ok) {
+            const text = await response.text();
+            throw Object.assign(new Error(`Tavily responded with ${response.status}: ${text}`), {
+              status: response.status
+            });
+          }
 
-    throw lastError instanceof Error ? lastError : new Error('Tavily search failed');
+          const output = toSearchOutput((await response.json()) as TavilyResponse);
+          logger.info('Tavily search completed', { attempt, results: output.sources.length });
+          await this.cache?.set(cacheKey, JSON.stringify(output));
+          return output;
+        } finally {
+          clearTimeout(timer);
+        }
+      },
+      { label: 'Tavily search', attempts: this.maxRetries, initialDelayMs: 500 }
+    );
   }
 }
+
+function toSearchOutput(data: TavilyResponse): TavilySearchOutput {
+  return {
+    summary: data.answer ?? 'No summary available.',
+    sources:
+      data.results?.map(({ title, url, content, score }) => ({
+        title,
+        url,
+        content,
+        score,
+        preview: content.length > PREVIEW_LENGTH ? `${content.slice(0, PREVIEW_LENGTH)}...` : content
+      })) ?? []
+  };
+}
@@ -40,16 +40,25 @@ export const domainConfigSchema = z.object({
 });
 
 export type DomainConfig = z.infer<typeof domainConfigSchema>;
+type Domain = DomainConfig['domains'][number];
+
+// Built once per loaded config so lookups by id do not rescan the domain list.
+const domainIndex = new WeakMap<DomainConfig, Map<string, Domain>>();
 
 export function loadConfig(configPath: string): DomainConfig {
   const resolved = path.resolve(configPath);
   const raw = readFileSync(resolved, 'utf-8');
   const parsed = JSON.parse(raw);
   const normalized = normalizeConfigShape(parsed);
-  return domainConfigSchema.parse(normalized);
+  const config = domainConfigSchema.parse(normalized);
+  // Reversed so the first domain wins on duplicate ids, matching the linear-scan fallback.
+  domainIndex.set(config, new Map(config.domains.map((domain) => [domain.id, domain] as const).reverse()));
+  return config;
 }
 
 export function findDomainById(config: DomainConfig, domainId: string) {
+  const index = domainIndex.get(config);
+  if (index) return index.get(domainId);
   return config.domains.find((domain) => domain.id === domainId);
 }
 
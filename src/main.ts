@@ -1,6 +1,6 @@
 import { parseArgs } from 'node:util';
 import { config as loadEnv } from 'dotenv';
-import { findDomainById, loadConfig } from './config.js';
+import { findDomainById, loadConfig, type DomainConfig } from './config.js';
 import { KaizenWorkflow } from './workflow/kaizen-workflow.js';
 import { logger } from './utils/logger.js';
 
@@ -10,46 +10,100 @@ async function main() {
   const args = parseArgs({
     options: {
       'domain-id': { type: 'string', short: 'd' },
+      'domain-ids': { type: 'string' },
+      all: { type: 'boolean', default: false },
       config: { type: 'string', short: 'c', default: 'config/domains.json' },
       'content-base': { type: 'string', default: '.' },
       'issue-repo': { type: 'string' },
       'github-token': { type: 'string' },
-      'dry-run': { type: 'boolean', default: false }
+      'dry-run': { type: 'boolean', default: false },
+      'cache-dir': { type: 'string', default: '.kaizen-cache' },
+      'cache-ttl': { type: 'string', default: '3600' },
+      'tavily-cache-ttl': { type: 'string', default: '86400' },
+      'no-cache': { type: 'boolean', default: false },
+      'state-dir': { type: 'string', default: '.kaizen-state' },
+      'max-skip-age': { type: 'string', default: '252' },
+      force: { type: 'boolean', default: false }
     },
     strict: true
   }).values;
 
-  if (!args['domain-id']) {
-    throw new Error('Missing required flag: --domain-id');
-  }
-
   const configPath = args.config ?? 'config/domains.json';
   const config = loadConfig(configPath);
-  const domain = findDomainById(config, args['domain-id']);
-
-  if (!domain) {
-    throw new Error(`Domain not found: ${args['domain-id']}`);
+  if (args.all && (args['domain-id'] || args['domain-ids'])) {
+    throw new Error('--all cannot be combined with --domain-id or --domain-ids');
   }
+  const domains = args.all ? config.domains : resolveDomains(config, args['domain-id'], args['domain-ids']);
 
   if (!process.env.GITHUB_REPOSITORY && args['issue-repo']) {
     process.env.GITHUB_REPOSITORY = args['issue-repo'];
   }
 
+  const cacheTtlSeconds = parsePositive('cache-ttl', args['cache-ttl']);
+  const tavilyCacheTtlSeconds = parsePositive('tavily-cache-ttl', args['tavily-cache-ttl']);
+  const maxSkipAgeHours = parsePositive('max-skip-age', args['max-skip-age']);
+
   const workflow = new KaizenWorkflow();
-  const result = await workflow.run({
-    domain,
-    config,
-    context: {
-      contentBase: args['content-base'],
-      githubToken: args['github-token'],
-      issueRepoOverride: args['issue-repo']
-    },
-    dryRun: args['dry-run'] ?? false
+  const context = {
+    contentBase: args['content-base'],
+    githubToken: args['github-token'],
+    issueRepoOverride: args['issue-repo'],
+    cacheDir: args['no-cache'] ? undefined : args['cache-dir'],
+    cacheTtlSeconds,
+    tavilyCacheTtlSeconds,
+    stateDir: args['state-dir'],
+    maxSkipAgeHours,
+    force: args.force ?? false
+  };
+  const results = await workflow.runMany(
+    domains.map((domain) => ({ domain, config, context, dryRun: args['dry-run'] ?? false }))
+  );
+
+  const [first] = results;
+  if (results.length === 1 && first.status === 'rejected') {
+    throw first.reason;
+  }
+
+  results.forEach((result, index) => {
+    const domainId = domains[index].id;
+    if (result.status === 'rejected') {
+      const err = result.reason as Error & { cause?: Error };
+      logger.error('Domain analysis failed', { domain: domainId, error: err.message, cause: err.cause?.message });
+      process.exitCode = 1;
+      return;
+    }
+    logger.info('Analysis completed', { domain: domainId, issueUrl: result.value.issueUrl });
+    if (results.length > 1) {
+      // eslint-disable-next-line no-console
+      console.log(`===== ${domainId} =====`);
+    }
+    // eslint-disable-next-line no-console
+    console.log(result.value.analysis.fullResponse);
   });
+}
+
+function resolveDomains(config: DomainConfig, domainId?: string, domainIds?: string) {
+  const ids = domainIds ? domainIds.split(',').map((id) => id.trim()).filter(Boolean) : [];
+  if (domainId) ids.unshift(domainId);
+  if (ids.length === 0) {
+    throw new Error('Missing required flag: --domain-id (or --domain-ids / --all)');
+  }
 
-  logger.info('Analysis completed', { issueUrl: result.issueUrl });
-  // eslint-disable-next-line no-console
-  console.log(result.analysis.fullResponse);
+  return [...new Set(ids)].map((id) => {
+    const domain = findDomainById(config, id);
+    if (!domain) {
+      throw new Error(`Domain not found: ${id}`);
+    }
+    return domain;
+  });
+}
+
+function parsePositive(flag: string, value: string | undefined) {
+  const parsed = Number(value);
+  if (!Number.isFinite(parsed) || parsed <= 0) {
+    throw new Error(`Invalid --${flag}: ${value}`);
+  }
+  return parsed;
 }
 
 main().catch((error) => {
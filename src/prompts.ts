@@ -53,35 +53,41 @@ ${currentContent}
 }
 
 export function parseAnalysis(fullResponse: string): AnalysisOutput {
+  const sections = parseSections(fullResponse);
   return {
-    gapAnalysis: extractSection(fullResponse, ['ギャップ分析', 'Gap Analysis']),
-    recommendations: extractSection(fullResponse, ['推奨事項', 'Recommendations']),
-    implementationGuide: extractSection(fullResponse, ['実装ガイド', 'Implementation Guide']),
+    gapAnalysis: pickSection(sections, ['ギャップ分析', 'Gap Analysis']),
+    recommendations: pickSection(sections, ['推奨事項', 'Recommendations']),
+    implementationGuide: pickSection(sections, ['実装ガイド', 'Implementation Guide']),
     fullResponse
   };
 }
 
+/** Splits a Markdown response into `## heading` -> body in a single pass. */
+export function parseSections(text: string): Map<string, string> {
+  const sections = new Map<string, string>();
+  const headers = [...text.matchAll(/^##[ \t]+(.+?)[ \t]*$/gm)];
+  headers.forEach((header, index) => {
+    const start = header.index! + header[0].length;
+    const end = headers[index + 1]?.index ?? text.length;
+    const key = header[1].toLowerCase();
+    if (!sections.has(key)) {
+      sections.set(key, text.slice(start, end).trim());
+    }
+  });
+  return sections;
+}
+
 function formatSources(sources: ResearchOutput['sources']): string {
   return sources
     .slice(0, 5)
-    .map((source) => {
-      const content = source.content.length > 200 ? `${source.content.slice(0, 200)}...` : source.content;
-      return `- ${source.title}: ${content}`;
-    })
+    .map((source) => `- ${source.title}: ${source.preview}`)
     .join('\n');
 }
 
-function extractSection(text: string, headings: string[]): string {
+function pickSection(sections: Map<string, string>, headings: string[]): string {
   for (const heading of headings) {
-    const pattern = new RegExp(`##\\s+${escapeRegex(heading)}\\s*\\n([\\s\\S]*?)(?=\\n##\\s+|$)`, 'i');
-    const match = text.match(pattern);
-    if (match?.[1]) {
-      return match[1].trim();
-    }
+    const body = sections.get(heading.toLowerCase());
+    if (body) return body;
   }
   return '';
 }
-
-function escapeRegex(value: string) {
-  return value.replace(/[.*+?^${}()|[\\]\\]/g, '\\$&');
-}
@@ -6,6 +6,8 @@ export interface SearchResult {
   url: string;
   content: string;
   score: number;
+  /** First 200 characters of `content`, computed once at ingest for prompt building. */
+  preview: string;
 }
 
 export interface ResearchOutput {
@@ -29,4 +31,10 @@ export interface WorkflowContext {
   contentBase: string;
   githubToken?: string;
   issueRepoOverride?: string;
+  cacheDir?: string;
+  cacheTtlSeconds?: number;
+  tavilyCacheTtlSeconds?: number;
+  stateDir?: string;
+  maxSkipAgeHours?: number;
+  force?: boolean;
 }
@@ -3,24 +3,41 @@ import path from 'node:path';
 import fg from 'fast-glob';
 import { logger } from './logger.js';
 
+const MAX_CONCURRENT_READS = 32;
+
 export async function readTargetFiles(targetPatterns: string[], basePath: string): Promise<string> {
   const cwd = path.resolve(basePath);
-  const files = await fg(targetPatterns, { cwd, absolute: true, dot: false, onlyFiles: true });
+  // fast-glob walks the tree once for all patterns and de-duplicates overlapping matches; sorting
+  // keeps the output (and any cache key derived from it) stable between runs.
+  const files = (await fg(targetPatterns, { cwd, absolute: true, dot: false, onlyFiles: true })).sort();
 
   if (files.length === 0) {
     return 'No matching files found.';
   }
 
-  const chunks: string[] = [];
-  for (const file of files) {
-    try {
-      const content = await readFile(file, 'utf-8');
-      const relative = path.relative(cwd, file);
-      chunks.push(`### File: ${relative}\n\n${content}`);
-    } catch (error) {
-      logger.warn('Failed to read file', { file, error: (error as Error).message });
+  const contents = new Array<string | undefined>(files.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < files.length) {
+      const index = next++;
+      try {
+        contents[index] = await readFile(files[index], 'utf-8');
+      } catch (error) {
+        logger.warn('Failed to read file', { file: files[index], error: (error as Error).message });
+      }
     }
-  }
+  };
+  await Promise.all(Array.from({ length: Math.min(MAX_CONCURRENT_READS, files.length) }, worker));
+
+  // Header, path, body and separator go straight into one parts list so the single join()
+  // copies each file once instead of first building a per-file chunk.
+  const parts: string[] = [];
+  files.forEach((file, index) => {
+    const content = contents[index];
+    if (content === undefined) return;
+    if (parts.length) parts.push('\n\n---\n\n');
+    parts.push('### File: ', path.relative(cwd, file), '\n\n', content);
+  });
 
-  return chunks.join('\n\n---\n\n');
+  return parts.join('');
 }
@@ -0,0 +1,8 @@
+export function escapeRegex(value: string) {
+  return value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+export function buildTermMatcher(terms: string[]): RegExp | undefined {
+  const alternatives = terms.filter(Boolean).map(escapeRegex);
+  return alternatives.length ? new RegExp(alternatives.join('|'), 'i') : undefined;
+}
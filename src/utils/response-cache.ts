@@ -0,0 +1,103 @@
+import { createHash } from 'node:crypto';
+import { mkdir, readFile, readdir, rename, rm, stat, utimes, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import { logger } from './logger.js';
+
+export interface ResponseCacheOptions {
+  dir: string;
+  ttlSeconds?: number;
+  maxEntries?: number;
+}
+
+interface CacheEntry {
+  response: string;
+  expires_at: number;
+}
+
+export function hashKey(...parts: Array<string | number>): string {
+  return createHash('sha256').update(parts.join('\0')).digest('hex');
+}
+
+/**
+ * File-backed exact-match cache. Entries live at `{dir}/{key[:2]}/{key}.json` and expire after
+ * `ttlSeconds`; once more than `maxEntries` exist the least recently used ones are removed.
+ */
+export class ResponseCache {
+  private readonly dir: string;
+  private readonly ttlSeconds: number;
+  private readonly maxEntries: number;
+
+  constructor(options: ResponseCacheOptions) {
+    this.dir = path.resolve(options.dir);
+    this.ttlSeconds = options.ttlSeconds ?? 3600;
+    this.maxEntries = options.maxEntries ?? 500;
+  }
+
+  async get(key: string): Promise<string | undefined> {
+    const file = this.pathFor(key);
+    try {
+      const entry = JSON.parse(await readFile(file, 'utf-8')) as CacheEntry;
+      if (entry.expires_at <= Date.now() / 1000) {
+        await rm(file, { force: true });
+        return undefined;
+      }
+      const now = new Date();
+      await utimes(file, now, now);
+      return entry.response;
+    } catch (error) {
+      if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+        logger.warn('Failed to read cache entry', { key, error: (error as Error).message });
+      }
+      return undefined;
+    }
+  }
+
+  async set(key: string, response: string): Promise<void> {
+    const file = this.pathFor(key);
+    const entry: CacheEntry = { response, expires_at: Date.now() / 1000 + this.ttlSeconds };
+    try {
+      await mkdir(path.dirname(file), { recursive: true });
+      const tmp = `${file}.${process.pid}.tmp`;
+      await writeFile(tmp, JSON.stringify(entry), 'utf-8');
+      await rename(tmp, file);
+    } catch (error) {
+      logger.warn('Failed to write cache entry', { key, error: (error as Error).message });
+      return;
+    }
+
+    try {
+      await this.evict();
+    } catch (error) {
+      logger.warn('Failed to evict cache entries', { error: (error as Error).message });
+    }
+  }
+
+  private pathFor(key: string) {
+    return path.join(this.dir, key.slice(0, 2), `${key}.json`);
+  }
+
+  private async evict() {
+    const files = (await readdir(this.dir, { recursive: true }))
+      .filter((name) => name.endsWith('.json'))
+      .map((name) => path.join(this.dir, name));
+    if (files.length <= this.maxEntries) return;
+
+    // Concurrent writers may evict the same files, so entries that vanish mid-scan are skipped.
+    const entries = (
+      await Promise.all(
+        files.map(async (file) => {
+          try {
+            return { file, mtimeMs: (await stat(file)).mtimeMs };
+          } catch (error) {
+            if ((error as NodeJS.ErrnoException).code === 'ENOENT') return undefined;
+            throw error;
+          }
+        })
+      )
+    ).filter((entry): entry is { file: string; mtimeMs: number } => entry !== undefined);
+    entries.sort((a, b) => a.mtimeMs - b.mtimeMs);
+    await Promise.all(
+      entries.slice(0, entries.length - this.maxEntries).map(({ file }) => rm(file, { force: true }))
+    );
+  }
+}
@@ -0,0 +1,52 @@
+import { setTimeout as sleep } from 'node:timers/promises';
+import { logger } from './logger.js';
+
+export interface RetryOptions {
+  label: string;
+  attempts?: number;
+  initialDelayMs?: number;
+  maxDelayMs?: number;
+  /** Decides whether a failure may be retried; defaults to `isRetryableError`. */
+  shouldRetry?: (error: unknown) => boolean;
+}
+
+/** Network errors (no status) and 408/429/5xx are transient; other HTTP errors fail fast. */
+export function isRetryableError(error: unknown): boolean {
+  const status = (error as { status?: unknown } | undefined)?.status;
+  if (typeof status !== 'number') return true;
+  return status === 408 || status === 429 || status >= 500;
+}
+
+/**
+ * Only throttling is safe to retry for non-idempotent requests: a 5xx or dropped connection may
+ * arrive after the server already applied the write.
+ */
+export function isRateLimitError(error: unknown): boolean {
+  return (error as { status?: unknown } | undefined)?.status === 429;
+}
+
+/** Runs `task` with exponential backoff plus jitter between attempts. */
+export async function withRetry<T>(task: (attempt: number) => Promise<T>, options: RetryOptions): Promise<T> {
+  const attempts = options.attempts ?? 3;
+  const initialDelayMs = options.initialDelayMs ?? 1000;
+  const maxDelayMs = options.maxDelayMs ?? 10_000;
+  const shouldRetry = options.shouldRetry ?? isRetryableError;
+
+  for (let attempt = 1; ; attempt += 1) {
+    try {
+      return await task(attempt);
+    } catch (error) {
+      const retrying = attempt < attempts && shouldRetry(error);
+      logger.warn(`${options.label} failed`, {
+        attempt,
+        status: (error as { status?: number }).status,
+        error: (error as Error).message,
+        retrying
+      });
+      if (!retrying) throw error;
+
+      const backoff = Math.min(maxDelayMs, initialDelayMs * 2 ** (attempt - 1));
+      await sleep(backoff / 2 + Math.random() * (backoff / 2));
+    }
+  }
+}
@@ -0,0 +1,41 @@
+import { mkdir, readFile, rename, writeFile } from 'node:fs/promises';
+import path from 'node:path';
+import type { ResearchOutput } from '../types.js';
+import { logger } from './logger.js';
+
+/** Outcome of the last successful run for a domain, used to skip unchanged re-analysis. */
+export interface RunState {
+  contentHash: string;
+  issueNumber: number;
+  issueUrl: string;
+  fullResponse: string;
+  research: ResearchOutput;
+  lastRun: string;
+}
+
+export async function loadRunState(stateDir: string, domainId: string): Promise<RunState | undefined> {
+  try {
+    return JSON.parse(await readFile(statePath(stateDir, domainId), 'utf-8')) as RunState;
+  } catch (error) {
+    if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+      logger.warn('Failed to read run state', { domainId, error: (error as Error).message });
+    }
+    return undefined;
+  }
+}
+
+export async function saveRunState(stateDir: string, domainId: string, state: RunState): Promise<void> {
+  const file = statePath(stateDir, domainId);
+  try {
+    await mkdir(path.dirname(file), { recursive: true });
+    const tmp = `${file}.${process.pid}.tmp`;
+    await writeFile(tmp, JSON.stringify(state, null, 2), 'utf-8');
+    await rename(tmp, file);
+  } catch (error) {
+    logger.warn('Failed to write run state', { domainId, error: (error as Error).message });
+  }
+}
+
+function statePath(stateDir: string, domainId: string) {
+  return path.join(path.resolve(stateDir), `${domainId}.json`);
+}
@@ -1,12 +1,23 @@
+import path from 'node:path';
 import { z } from 'zod';
 import { Flow } from '@mastra/core';
-import { AnthropicClientWrapper } from '../clients/anthropic.js';
+import { AnthropicClientWrapper, MODEL, SYSTEM_PROMPT_DIGEST } from '../clients/anthropic.js';
 import { GitHubClient } from '../clients/github.js';
 import { TavilyClient } from '../clients/tavily.js';
 import { domainConfigSchema, domainSchema } from '../config.js';
+import { parseAnalysis } from '../prompts.js';
 import type { AnalysisOutput, DomainDefinition, DomainConfig, ResearchOutput, WorkflowContext } from '../types.js';
 import { logger } from '../utils/logger.js';
 import { readTargetFiles } from '../utils/file-reader.js';
+import { buildTermMatcher } from '../utils/regex.js';
+import { ResponseCache, hashKey } from '../utils/response-cache.js';
+import { loadRunState, saveRunState, type RunState } from '../utils/run-state.js';
+import { Semaphore } from '../utils/semaphore.js';
+
+// 1.5 weeks: each domain runs weekly (`day_of_week`) and a skip does not refresh `lastRun`, so an
+// unchanged domain skips the next week and is re-analysed the week after. Keeping the limit off a
+// multiple of the cadence means job-start jitter never decides the skip.
+const DEFAULT_MAX_SKIP_AGE_HOURS = 252;
 
 export interface KaizenRunInput {
   domain: DomainDefinition;
@@ -15,9 +26,27 @@ export interface KaizenRunInput {
   dryRun?: boolean;
 }
 
+interface PreviousRun {
+  contentHash: string;
+  /** Set when the content is unchanged since a recent run whose issue is still open. */
+  unchanged?: RunState;
+}
+
 export class KaizenWorkflow {
   private readonly flow: Flow<KaizenRunInput, WorkflowContext, { research: ResearchOutput; analysis: AnalysisOutput; issueUrl?: string }>; // eslint-disable-line max-len
 
+  // Clients are created lazily and reused by later runs built from the same settings, so the
+  // Anthropic/Octokit keep-alive agents stay warm without one run's token or repo leaking into another.
+  private readonly resolved = new Map<string, unknown>();
+
+  // Per-host concurrency caps shared by every run on this instance; GitHub search is limited to
+  // 30 requests per minute, so it gets the tightest cap.
+  private readonly limits = {
+    tavily: new Semaphore(8),
+    anthropic: new Semaphore(4),
+    github: new Semaphore(2)
+  };
+
   constructor(private readonly clients?: {
     tavily?: TavilyClient;
     anthropic?: AnthropicClientWrapper;
@@ -31,6 +60,54 @@ export class KaizenWorkflow {
     return output;
   }
 
+  /** Runs several domains concurrently; one domain failing does not abort the others. */
+  async runMany(inputs: KaizenRunInput[]) {
+    return Promise.allSettled(inputs.map((input) => this.run(input)));
+  }
+
+  private getTavily(context: WorkflowContext) {
+    if (this.clients?.tavily) return this.clients.tavily;
+    const ttlSeconds = context.tavilyCacheTtlSeconds ?? 86_400;
+    return this.memoize(['tavily', context.cacheDir, ttlSeconds], () =>
+      new TavilyClient({
+        cache: context.cacheDir
+          ? new ResponseCache({ dir: path.join(context.cacheDir, 'tavily'), ttlSeconds })
+          : undefined
+      })
+    );
+  }
+
+  private getAnthropic(config: DomainConfig, context: WorkflowContext) {
+    if (this.clients?.anthropic) return this.clients.anthropic;
+    const temperature = config.global_settings.analysis_temperature;
+    return this.memoize(['anthropic', temperature, context.cacheDir, context.cacheTtlSeconds], () =>
+      new AnthropicClientWrapper({
+        temperature,
+        cache: context.cacheDir
+          ? new ResponseCache({
+              dir: path.join(context.cacheDir, 'anthropic'),
+              ttlSeconds: context.cacheTtlSeconds
+            })
+          : undefined
+      })
+    );
+  }
+
+  private getGitHub(context: WorkflowContext) {
+    if (this.clients?.github) return this.clients.github;
+    return this.memoize(['github', context.githubToken, context.issueRepoOverride], () =>
+      new GitHubClient({ token: context.githubToken, repository: context.issueRepoOverride })
+    );
+  }
+
+  private memoize<T>(settings: unknown[], create: () => T): T {
+    const key = JSON.stringify(settings);
+    if (!this.resolved.has(key)) {
+      this.resolved.set(key, create());
+    }
+    return this.resolved.get(key) as T;
+  }
+
   private createFlow() {
     return new Flow<KaizenRunInput, WorkflowContext, { research: ResearchOutput; analysis: AnalysisOutput; issueUrl?: string }>({
       id: 'dotfiles-kaizen',
@@ -40,22 +117,37 @@ export class KaizenWorkflow {
         context: z.object({
           contentBase: z.string(),
           githubToken: z.string().optional(),
-          issueRepoOverride: z.string().optional()
+          issueRepoOverride: z.string().optional(),
+          cacheDir: z.string().optional(),
+          cacheTtlSeconds: z.number().positive().optional(),
+          tavilyCacheTtlSeconds: z.number().positive().optional(),
+          stateDir: z.string().optional(),
+          maxSkipAgeHours: z.number().positive().optional(),
+          force: z.boolean().optional()
         }),
         dryRun: z.boolean().optional()
       }),
       steps: {
         research: {
-          run: async ({ input }) => {
-            const tavily = this.clients?.tavily ?? new TavilyClient();
+          // Waits for the skip decision so an unchanged run spends no Tavily call. A run that is
+          // not skipped pays only the local file reads, hash and state-file load before searching;
+          // the GitHub issue check runs only when the stored state already matches.
+          dependsOn: ['previousRun'],
+          run: async ({ input, stepResults }) => {
+            const { unchanged } = stepResults.previousRun as PreviousRun;
+            if (unchanged) return unchanged.research;
+
+            const tavily = this.getTavily(input.context);
             const maxResults = input.config.global_settings.max_search_results;
             logger.info('Starting trend collection', { domain: input.domain.name });
             const query = buildSearchQuery(input.domain);
-            const { summary, sources } = await tavily.search(query, {
-              maxResults,
-              excludeDomains: input.domain.search_hints.exclude_domains,
-              includeDomains: input.domain.search_hints.include_domains
-            });
+            const { summary, sources } = await this.limits.tavily.run(() =>
+              tavily.search(query, {
+                maxResults,
+                excludeDomains: input.domain.search_hints.exclude_domains,
+                includeDomains: input.domain.search_hints.include_domains
+              })
+            );
             const filtered = filterSourcesByExclusions(sources, input.domain.search_hints.exclude_terms);
             return {
               summary,
@@ -65,34 +157,87 @@ export class KaizenWorkflow {
           }
         },
         collectContent: {
-          dependsOn: ['research'],
           run: async ({ input }) => {
             logger.info('Reading target files', { base: input.context.contentBase });
             return readTargetFiles(input.domain.target_files, input.context.contentBase);
           }
         },
+        previousRun: {
+          dependsOn: ['collectContent'],
+          run: async ({ input, stepResults }): Promise<PreviousRun> => {
+            // Covers everything the research and analysis are built from, so editing the domain, the
+            // prompt, the model or the temperature forces a fresh run; none of it needs an API call.
+            const contentHash = hashKey(
+              MODEL,
+              SYSTEM_PROMPT_DIGEST,
+              input.config.global_settings.analysis_temperature,
+              input.config.global_settings.max_search_results,
+              JSON.stringify(input.domain),
+              buildSearchQuery(input.domain),
+              stepResults.collectContent as string
+            );
+            const { stateDir, maxSkipAgeHours, force } = input.context;
+            if (!stateDir || input.dryRun || force) return { contentHash };
+
+            const state = await loadRunState(stateDir, input.domain.id);
+            if (state?.contentHash !== contentHash || !state.research) return { contentHash };
+            const ageHours = (Date.now() - Date.parse(state.lastRun)) / 3_600_000;
+            if (!(ageHours < (maxSkipAgeHours ?? DEFAULT_MAX_SKIP_AGE_HOURS))) return { contentHash };
+
+            // The skip is only an optimisation: if the stored issue cannot be checked (deleted,
+            // transferred, no access, GitHub down), fall back to a normal analysis.
+            try {
+              const github = this.getGitHub(input.context);
+              if (!(await this.limits.github.run(() => github.isIssueOpen(state.issueNumber)))) {
+                return { contentHash };
+              }
+            } catch (error) {
+              logger.warn('Could not verify previous issue; running full analysis', {
+                domain: input.domain.name,
+                issue: state.issueNumber,
+                error: (error as Error).message
+              });
+              return { contentHash };
+            }
+            logger.info('No changes detected; skipping analysis', {
+              domain: input.domain.name,
+              issue: state.issueNumber
+            });
+            return { contentHash, unchanged: state };
+          }
+        },
         analyze: {
-          dependsOn: ['research', 'collectContent'],
+          dependsOn: ['research', 'collectContent', 'previousRun'],
           run: async ({ input, stepResults }) => {
+            const { unchanged } = stepResults.previousRun as PreviousRun;
+            if (unchanged) return parseAnalysis(unchanged.fullResponse);
+
             const researchOutput = stepResults.research as ResearchOutput;
             const currentContent = stepResults.collectContent as string;
-            const anthropic = this.clients?.anthropic ??
-              new AnthropicClientWrapper({ temperature: input.config.global_settings.analysis_temperature });
+            const anthropic = this.getAnthropic(input.config, input.context);
             logger.info('Starting analysis', { domain: input.domain.name });
-            return anthropic.analyze(input.domain, researchOutput, currentContent);
+            return this.limits.anthropic.run(() => anthropic.analyze(input.domain, researchOutput, currentContent));
+          }
+        },
+        existingIssue: {
+          dependsOn: ['previousRun'],
+          run: async ({ input, stepResults }) => {
+            if (input.dryRun || (stepResults.previousRun as PreviousRun).unchanged) return undefined;
+            const github = this.getGitHub(input.context);
+            return this.limits.github.run(() => github.findExistingIssue(`[Dotfiles Kaizen] ${input.domain.name}`));
           }
         },
         report: {
-          dependsOn: ['research', 'analyze'],
+          dependsOn: ['research', 'analyze', 'existingIssue', 'previousRun'],
           run: async ({ input, stepResults }) => {
-            const github =
-              this.clients?.github ??
-              new GitHubClient({ token: input.context.githubToken, repository: input.context.issueRepoOverride });
+            const previousRun = stepResults.previousRun as PreviousRun;
+            if (previousRun.unchanged) return previousRun.unchanged.issueUrl;
 
             const researchOutput = stepResults.research as ResearchOutput;
             const analysisOutput = stepResults.analyze as AnalysisOutput;
 
-            const { title, body, labels } = buildIssuePayload(input.domain, input.config, researchOutput, analysisOutput);
+            const now = new Date();
+            const { title, body, labels } = buildIssuePayload(input.domain, input.config, researchOutput, analysisOutput, now);
             logger.info('Preparing issue payload', { title });
 
             if (input.dryRun) {
@@ -100,14 +245,27 @@ export class KaizenWorkflow {
               return `DRY-RUN: ${title}`;
             }
 
-            const existing = await github.findExistingIssue(`[Dotfiles Kaizen] ${input.domain.name}`);
+            const github = this.getGitHub(input.context);
+            const existing = stepResults.existingIssue as Awaited<ReturnType<GitHubClient['findExistingIssue']>>;
+            let issue: { number: number; html_url: string };
             if (existing) {
-              const commentBody = buildCommentBody(researchOutput, analysisOutput);
-              await github.addComment(existing.number, commentBody);
-              return existing.html_url;
+              const commentBody = buildCommentBody(researchOutput, analysisOutput, now);
+              await this.limits.github.run(() => github.addComment(existing.number, commentBody));
+              issue = existing;
+            } else {
+              issue = await this.limits.github.run(() => github.createIssue({ title, body, labels }));
             }
 
-            const issue = await github.createIssue({ title, body, labels });
+            if (input.context.stateDir) {
+              await saveRunState(input.context.stateDir, input.domain.id, {
+                contentHash: previousRun.contentHash,
+                issueNumber: issue.number,
+                issueUrl: issue.html_url,
+                fullResponse: analysisOutput.fullResponse,
+                research: researchOutput,
+                lastRun: now.toISOString()
+              });
+            }
             return issue.html_url;
           }
         }
@@ -128,17 +286,21 @@ function buildSearchQuery(domain: DomainDefinition) {
 }
 
 function filterSourcesByExclusions(sources: ResearchOutput['sources'], excludeTerms: string[] = []): ResearchOutput['sources'] {
-  if (!excludeTerms.length) return sources;
-  const lower = excludeTerms.map((term) => term.toLowerCase());
-  return sources.filter((source) => {
-    const title = source.title.toLowerCase();
-    const content = source.content.toLowerCase();
-    return !lower.some((term) => title.includes(term) || content.includes(term));
-  });
+  // One case-insensitive alternation scans each source once instead of once per term.
+  const matcher = buildTermMatcher(excludeTerms);
+  if (!matcher) return sources;
+  return sources.filter((source) => !matcher.test(`${source.title}\n${source.content}`));
 }
 
-function buildIssuePayload(domain: DomainDefinition, config: DomainConfig, research: ResearchOutput, analysis: AnalysisOutput) {
-  const today = new Date().toISOString().slice(0, 10);
+function buildIssuePayload(
+  domain: DomainDefinition,
+  config: DomainConfig,
+  research: ResearchOutput,
+  analysis: AnalysisOutput,
+  now: Date
+) {
+  const timestamp = now.toISOString();
+  const today = timestamp.slice(0, 10);
   const title = `[Dotfiles Kaizen] ${domain.name} - ${today}`;
   const labels = [
     ...(config.global_settings.issue_labels ?? ['dotfiles-kaizen']),
@@ -146,7 +308,7 @@ function buildIssuePayload(domain: DomainDefinition, config: DomainConfig, resea
   ];
   const body = `## 🔍 Analysis Overview
 - **Domain**: ${domain.name}
-- **Date**: ${new Date().toISOString()}
+- **Date**: ${timestamp}
 - **Search Query**: \`${research.searchQuery}\`
 
 ## 📊 Research Summary
@@ -163,8 +325,8 @@ ${formatSourcesList(research.sources)}
   return { title, body, labels };
 }
 
-function buildCommentBody(research: ResearchOutput, analysis: AnalysisOutput) {
-  const today = new Date().toISOString().slice(0, 10);
+function buildCommentBody(research: ResearchOutput, analysis: AnalysisOutput, now: Date) {
+  const today = now.toISOString().slice(0, 10);
   return `### Update: ${today}
 
 **Research Summary:**
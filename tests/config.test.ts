@@ -45,6 +45,16 @@ describe('findDomainById', () => {
     expect(domain?.name).toBe('TypeScript Best Practices');
   });
 
+  it('uses the index built by loadConfig', async () => {
+    const fs = await import('node:fs/promises');
+    const dir = await fs.mkdtemp('/tmp/dk-config-');
+    await fs.writeFile(`${dir}/config.json`, JSON.stringify(sampleConfig));
+
+    const config = loadConfig(`${dir}/config.json`);
+    expect(findDomainById(config, 'typescript-best-practices')).toBe(config.domains[0]);
+    expect(findDomainById(config, 'missing')).toBeUndefined();
+  });
+
   it('returns undefined for missing domain', () => {
     const domain = findDomainById(sampleConfig as any, 'missing');
     expect(domain).toBeUndefined();
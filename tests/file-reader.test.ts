@@ -19,3 +19,15 @@ it('handles missing matches', async () => {
   const result = await readTargetFiles(['*.md'], dir);
   expect(result).toBe('No matching files found.');
 });
+
+it('reads overlapping patterns once in sorted order', async () => {
+  const fs = await import('node:fs/promises');
+  const dir = await fs.mkdtemp('/tmp/dk-files-');
+  await fs.mkdir(`${dir}/docs`);
+  await fs.writeFile(`${dir}/docs/b.md`, '# Beta');
+  await fs.writeFile(`${dir}/docs/a.md`, '# Alpha');
+
+  const result = await readTargetFiles(['docs/*.md', '**/*.md'], dir);
+  expect(result.match(/### File: /g)).toHaveLength(2);
+  expect(result.indexOf('docs/a.md')).toBeLessThan(result.indexOf('docs/b.md'));
+});
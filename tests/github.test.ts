@@ -0,0 +1,42 @@
+import { expect, it } from 'vitest';
+import { GitHubClient } from '../src/clients/github.js';
+
+function createClient(search: (params: any) => Promise<any>) {
+  const client = new GitHubClient({ token: 'token', repository: 'owner/repo' });
+  (client as any).octokit = {
+    search: { issuesAndPullRequests: search },
+    issues: {
+      create: async (payload: any) => ({ data: { number: 9, html_url: 'https://github.com/issue/9', ...payload } })
+    }
+  };
+  return client;
+}
+
+it('remembers issues created in this process', async () => {
+  let searches = 0;
+  const client = createClient(async () => {
+    searches += 1;
+    return { data: { items: [] } };
+  });
+
+  expect(await client.findExistingIssue('[Dotfiles Kaizen] Sample')).toBeUndefined();
+  await client.createIssue({ title: '[Dotfiles Kaizen] Sample - 2026-01-01', body: 'body' });
+
+  expect(await client.findExistingIssue('[Dotfiles Kaizen] Sample')).toEqual({
+    number: 9,
+    html_url: 'https://github.com/issue/9'
+  });
+  expect(searches).toBe(1);
+});
+
+it('does not attach a new issue to a shorter prefix of another domain', async () => {
+  const client = createClient(async () => ({ data: { items: [] } }));
+
+  await client.createIssue({ title: '[Dotfiles Kaizen] Claude Commands - 2026-01-01', body: 'body' });
+
+  expect(await client.findExistingIssue('[Dotfiles Kaizen] Claude')).toBeUndefined();
+  expect(await client.findExistingIssue('[Dotfiles Kaizen] Claude Commands')).toEqual({
+    number: 9,
+    html_url: 'https://github.com/issue/9'
+  });
+});
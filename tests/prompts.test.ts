@@ -0,0 +1,29 @@
+import { expect, it } from 'vitest';
+import { parseAnalysis, parseSections } from '../src/prompts.js';
+
+const response = `## ギャップ分析
+古い記述があります。
+
+## 推奨事項
+### 高優先度
+- [ ] 例を更新する
+
+## 実装ガイド
+手順を記載します。
+`;
+
+it('splits level-two sections without breaking on subsections', () => {
+  const sections = parseSections(response);
+  expect([...sections.keys()]).toEqual(['ギャップ分析', '推奨事項', '実装ガイド']);
+  expect(sections.get('推奨事項')).toBe('### 高優先度\n- [ ] 例を更新する');
+});
+
+it('maps Japanese and English headings onto the analysis output', () => {
+  const analysis = parseAnalysis(response);
+  expect(analysis.gapAnalysis).toBe('古い記述があります。');
+  expect(analysis.implementationGuide).toBe('手順を記載します。');
+
+  const english = parseAnalysis('## Gap Analysis\nmissing\n## Recommendations\nadd docs');
+  expect(english.gapAnalysis).toBe('missing');
+  expect(english.recommendations).toBe('add docs');
+});
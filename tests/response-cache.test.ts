@@ -0,0 +1,40 @@
+import { describe, expect, it } from 'vitest';
+import { ResponseCache, hashKey } from '../src/utils/response-cache.js';
+
+async function tempDir() {
+  const fs = await import('node:fs/promises');
+  return fs.mkdtemp('/tmp/dk-cache-');
+}
+
+describe('ResponseCache', () => {
+  it('returns stored responses until they expire', async () => {
+    const dir = await tempDir();
+    const cache = new ResponseCache({ dir, ttlSeconds: 60 });
+    const key = hashKey('model', 'system', 'user', 0.3);
+
+    expect(await cache.get(key)).toBeUndefined();
+    await cache.set(key, 'cached-text');
+    expect(await cache.get(key)).toBe('cached-text');
+
+    const expired = new ResponseCache({ dir, ttlSeconds: -1 });
+    await expired.set(key, 'stale');
+    expect(await expired.get(key)).toBeUndefined();
+  });
+
+  it('evicts the least recently used entries beyond maxEntries', async () => {
+    const fs = await import('node:fs/promises');
+    const dir = await tempDir();
+    const cache = new ResponseCache({ dir, maxEntries: 2 });
+    const [a, b, c] = ['a', 'b', 'c'].map((value) => hashKey(value));
+
+    await cache.set(a, 'A');
+    await cache.set(b, 'B');
+    const past = new Date(Date.now() - 60_000);
+    await fs.utimes(`${dir}/${a.slice(0, 2)}/${a}.json`, past, past);
+    await cache.set(c, 'C');
+
+    expect(await cache.get(a)).toBeUndefined();
+    expect(await cache.get(b)).toBe('B');
+    expect(await cache.get(c)).toBe('C');
+  });
+});
@@ -0,0 +1,55 @@
+import { expect, it } from 'vitest';
+import { isRateLimitError, isRetryableError, withRetry } from '../src/utils/retry.js';
+
+const httpError = (status: number) => Object.assign(new Error(`status ${status}`), { status });
+
+it('retries transient failures until the task succeeds', async () => {
+  let calls = 0;
+  const result = await withRetry(
+    async () => {
+      calls += 1;
+      if (calls < 3) throw httpError(503);
+      return 'ok';
+    },
+    { label: 'test', attempts: 3, initialDelayMs: 1 }
+  );
+  expect(result).toBe('ok');
+  expect(calls).toBe(3);
+});
+
+it('fails fast on non-retryable HTTP errors', async () => {
+  let calls = 0;
+  await expect(
+    withRetry(
+      async () => {
+        calls += 1;
+        throw httpError(401);
+      },
+      { label: 'test', attempts: 3, initialDelayMs: 1 }
+    )
+  ).rejects.toThrow('status 401');
+  expect(calls).toBe(1);
+});
+
+it('classifies network errors and throttling as retryable', () => {
+  expect(isRetryableError(new Error('socket hang up'))).toBe(true);
+  expect(isRetryableError(httpError(429))).toBe(true);
+  expect(isRetryableError(httpError(529))).toBe(true);
+  expect(isRetryableError(httpError(404))).toBe(false);
+});
+
+it('lets callers restrict retries to rate limiting', async () => {
+  let calls = 0;
+  await expect(
+    withRetry(
+      async () => {
+        calls += 1;
+        throw httpError(502);
+      },
+      { label: 'test', attempts: 3, initialDelayMs: 1, shouldRetry: isRateLimitError }
+    )
+  ).rejects.toThrow('status 502');
+  expect(calls).toBe(1);
+  expect(isRateLimitError(httpError(429))).toBe(true);
+  expect(isRateLimitError(new Error('socket hang up'))).toBe(false);
+});
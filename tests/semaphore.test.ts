@@ -0,0 +1,25 @@
+import { expect, it } from 'vitest';
+import { Semaphore } from '../src/utils/semaphore.js';
+
+it('never runs more tasks than the limit at once', async () => {
+  const semaphore = new Semaphore(2);
+  let active = 0;
+  let peak = 0;
+
+  const task = async () => {
+    active += 1;
+    peak = Math.max(peak, active);
+    await new Promise((resolve) => setTimeout(resolve, 5));
+    active -= 1;
+  };
+
+  await Promise.all(Array.from({ length: 6 }, () => semaphore.run(task)));
+  expect(peak).toBe(2);
+  expect(active).toBe(0);
+});
+
+it('releases the slot when a task fails', async () => {
+  const semaphore = new Semaphore(1);
+  await expect(semaphore.run(async () => Promise.reject(new Error('boom')))).rejects.toThrow('boom');
+  await expect(semaphore.run(async () => 'ok')).resolves.toBe('ok');
+});
@@ -68,4 +68,228 @@ describe('KaizenWorkflow', () => {
     expect(result.analysis.fullResponse).toBe('full-text');
     expect(result.issueUrl).toContain('DRY-RUN');
   });
+
+  it('looks up the existing issue alongside analysis and comments on it', async () => {
+    const calls: string[] = [];
+    // Each call waits until the other has started, so sequential execution fails instead of passing.
+    let release!: () => void;
+    const bothInFlight = new Promise<void>((resolve) => {
+      release = resolve;
+    });
+    const arrive = (name: string) => {
+      calls.push(name);
+      if (calls.length === 2) release();
+      return Promise.race([
+        bothInFlight,
+        new Promise<never>((_, reject) => setTimeout(() => reject(new Error(`${name} ran alone`)), 1000))
+      ]);
+    };
+
+    const tavily = {
+      search: async () => ({ summary: 'summary', sources: [] })
+    } as any;
+
+    const anthropic = {
+      analyze: async () => {
+        await arrive('analyze');
+        return {
+          gapAnalysis: 'gap',
+          recommendations: 'recs',
+          implementationGuide: 'impl',
+          fullResponse: 'full-text'
+        } satisfies AnalysisOutput;
+      }
+    } as any;
+
+    const github = {
+      findExistingIssue: async () => {
+        await arrive('find');
+        return { number: 7, html_url: 'https://github.com/issue/7' };
+      },
+      createIssue: async () => {
+        throw new Error('should not create');
+      },
+      addComment: async (issueNumber: number) => {
+        calls.push(`comment:${issueNumber}`);
+        return {};
+      }
+    } as any;
+
+    const workflow = new KaizenWorkflow({ tavily, anthropic, github });
+    const result = await workflow.run({
+      domain,
+      config: config as any,
+      context: { contentBase: '.', githubToken: 'token', issueRepoOverride: 'owner/repo' }
+    });
+
+    expect(calls.slice(0, 2).sort()).toEqual(['analyze', 'find']);
+    expect(calls[2]).toBe('comment:7');
+    expect(result.issueUrl).toBe('https://github.com/issue/7');
+  });
+
+  it('runs several domains and isolates failures', async () => {
+    const tavily = {
+      search: async (query: string) => {
+        if (query.startsWith('broken')) throw new Error('search failed');
+        return { summary: 'summary', sources: [] };
+      }
+    } as any;
+
+    const anthropic = {
+      analyze: async () => ({
+        gapAnalysis: 'gap',
+        recommendations: 'recs',
+        implementationGuide: 'impl',
+        fullResponse: 'full-text'
+      } satisfies AnalysisOutput)
+    } as any;
+
+    const broken = {
+      ...domain,
+      id: 'broken',
+      name: 'Broken Domain',
+      search_hints: { ...domain.search_hints, primary_keywords: ['broken'] }
+    };
+
+    const workflow = new KaizenWorkflow({ tavily, anthropic, github: {} as any });
+    const context = { contentBase: '.', githubToken: 'token', issueRepoOverride: 'owner/repo' };
+    const results = await workflow.runMany([
+      { domain, config: config as any, context, dryRun: true },
+      { domain: broken, config: config as any, context, dryRun: true }
+    ]);
+
+    expect(results.map((result) => result.status)).toEqual(['fulfilled', 'rejected']);
+  });
+
+  it('skips analysis when content is unchanged since the last run', async () => {
+    const fs = await import('node:fs/promises');
+    const contentBase = await fs.mkdtemp('/tmp/dk-content-');
+    const stateDir = await fs.mkdtemp('/tmp/dk-state-');
+    await fs.writeFile(`${contentBase}/skill.md`, '# Skill');
+
+    let analyses = 0;
+    let searches = 0;
+    const tavily = {
+      search: async () => {
+        searches += 1;
+        return { summary: 'summary', sources: [] };
+      }
+    } as any;
+    const anthropic = {
+      analyze: async () => {
+        analyses += 1;
+        return {
+          gapAnalysis: 'gap',
+          recommendations: 'recs',
+          implementationGuide: 'impl',
+          fullResponse: '## ギャップ分析\ngap'
+        } satisfies AnalysisOutput;
+      }
+    } as any;
+    const github = {
+      findExistingIssue: async () => undefined,
+      createIssue: async () => ({ number: 5, html_url: 'https://github.com/issue/5' }),
+      isIssueOpen: async () => true
+    } as any;
+
+    const workflow = new KaizenWorkflow({ tavily, anthropic, github });
+    const input = {
+      domain,
+      config: config as any,
+      context: { contentBase, githubToken: 'token', issueRepoOverride: 'owner/repo', stateDir }
+    };
+
+    await workflow.run(input);
+    const second = await workflow.run(input);
+
+    expect(analyses).toBe(1);
+    expect(searches).toBe(1);
+    expect(second.issueUrl).toBe('https://github.com/issue/5');
+    expect(second.analysis.gapAnalysis).toBe('gap');
+    expect(second.research.summary).toBe('summary');
+  });
+
+  it('re-analyses unchanged content when the domain definition changes', async () => {
+    const fs = await import('node:fs/promises');
+    const contentBase = await fs.mkdtemp('/tmp/dk-content-');
+    const stateDir = await fs.mkdtemp('/tmp/dk-state-');
+    await fs.writeFile(`${contentBase}/skill.md`, '# Skill');
+
+    let analyses = 0;
+    const tavily = { search: async () => ({ summary: 'summary', sources: [] }) } as any;
+    const anthropic = {
+      analyze: async () => {
+        analyses += 1;
+        return {
+          gapAnalysis: 'gap',
+          recommendations: 'recs',
+          implementationGuide: 'impl',
+          fullResponse: 'full-text'
+        } satisfies AnalysisOutput;
+      }
+    } as any;
+    const github = {
+      findExistingIssue: async () => undefined,
+      createIssue: async () => ({ number: 5, html_url: 'https://github.com/issue/5' }),
+      isIssueOpen: async () => true
+    } as any;
+
+    const workflow = new KaizenWorkflow({ tavily, anthropic, github });
+    const context = { contentBase, githubToken: 'token', issueRepoOverride: 'owner/repo', stateDir };
+    await workflow.run({ domain, config: config as any, context });
+    await workflow.run({ domain: { ...domain, description: 'Edited description' }, config: config as any, context });
+
+    expect(analyses).toBe(2);
+  });
+
+  it('keeps separate clients for runs with different GitHub settings', () => {
+    const workflow = new KaizenWorkflow() as any;
+    const first = workflow.getGitHub({ contentBase: '.', githubToken: 'a', issueRepoOverride: 'owner/one' });
+    const again = workflow.getGitHub({ contentBase: '.', githubToken: 'a', issueRepoOverride: 'owner/one' });
+    const other = workflow.getGitHub({ contentBase: '.', githubToken: 'b', issueRepoOverride: 'owner/two' });
+
+    expect(again).toBe(first);
+    expect(other).not.toBe(first);
+  });
+
+  it('falls back to a full analysis when the stored issue cannot be checked', async () => {
+    const fs = await import('node:fs/promises');
+    const contentBase = await fs.mkdtemp('/tmp/dk-content-');
+    const stateDir = await fs.mkdtemp('/tmp/dk-state-');
+    await fs.writeFile(`${contentBase}/skill.md`, '# Skill');
+
+    let analyses = 0;
+    const tavily = { search: async () => ({ summary: 'summary', sources: [] }) } as any;
+    const anthropic = {
+      analyze: async () => {
+        analyses += 1;
+        return {
+          gapAnalysis: 'gap',
+          recommendations: 'recs',
+          implementationGuide: 'impl',
+          fullResponse: 'full-text'
+        } satisfies AnalysisOutput;
+      }
+    } as any;
+    const github = {
+      findExistingIssue: async () => undefined,
+      createIssue: async () => ({ number: 5, html_url: 'https://github.com/issue/5' }),
+      isIssueOpen: async () => {
+        throw Object.assign(new Error('Not Found'), { status: 404 });
+      }
+    } as any;
+
+    const workflow = new KaizenWorkflow({ tavily, anthropic, github });
+    const input = {
+      domain,
+      config: config as any,
+      context: { contentBase, githubToken: 'token', issueRepoOverride: 'owner/repo', stateDir }
+    };
+
+    await workflow.run(input);
+    const second = await workflow.run(input);
+
+    expect(analyses).toBe(2);
+    expect(second.issueUrl).toBe('https://github.com/issue/5');
+  });
 });